@@ -0,0 +1,263 @@
+import argparse
+import contextlib
+import functools
+import importlib
+import json
+import pickle
+import sys
+import time
+
+
+# Planners are referenced by module path so that only the selected one is imported.
+PLANNERS = {
+    "dijkstra": ("src.path_planner.dijkstra", "DijkstraPathPlanner"),
+    "astar": ("src.path_planner.astar", "AStarPathPlanner"),
+    "anytime": ("src.path_planner.arastar", "AnytimeAStarPathPlanner"),
+}
+
+DEFAULT_CONFIG = "config/default_config.json"
+
+
+@functools.lru_cache(maxsize=None)
+def _load_config(file_path):
+    """
+    Load and validate a configuration file, once per path.
+
+    Args:
+        file_path (str): The path to the configuration file.
+
+    Returns:
+        dict: The validated configuration.
+    """
+    from src.config_loader import ConfigLoader
+
+    # Keep stdout clean for the JSON output of the plan subcommand
+    with contextlib.redirect_stdout(sys.stderr):
+        return ConfigLoader().load_config(file_path=file_path)
+
+
+def _load_graph(args):
+    """
+    Load a cached graph, or build it from the configuration.
+
+    Args:
+        args (argparse.Namespace): Parsed arguments with `graph` and `config` attributes.
+
+    Returns:
+        Graph: The loaded or newly built graph.
+    """
+    if args.graph:
+        with open(args.graph, 'rb') as file:
+            return pickle.load(file)
+
+    from src.graph import Graph
+
+    return Graph(config=_load_config(args.config))
+
+
+def _create_planner(name, graph):
+    """
+    Import and instantiate the requested path planner.
+
+    Args:
+        name (str): The planner name, one of the keys of `PLANNERS`.
+        graph (Graph): The graph to plan on.
+
+    Returns:
+        object: The path planner instance.
+    """
+    module_name, class_name = PLANNERS[name]
+    planner_class = getattr(importlib.import_module(module_name), class_name)
+    return planner_class(graph=graph)
+
+
+def _plan(planner, args, start, goal):
+    """
+    Plan a path, passing the search budget to the anytime planner.
+
+    Args:
+        planner (object): The path planner instance.
+        args (argparse.Namespace): Parsed arguments with `time_budget` and `max_expansions`.
+        start (tuple): The starting point's coordinates (x, y, z).
+        goal (tuple): The goal point's coordinates (x, y, z).
+
+    Returns:
+        list: The planned path, or None if no path was found.
+    """
+    if args.planner == "anytime":
+        return planner.plan_path(start=start, goal=goal,
+                                 time_budget=args.time_budget, max_expansions=args.max_expansions)
+    return planner.plan_path(start=start, goal=goal)
+
+
+def _resolve_endpoints(args):
+    """
+    Get the start and goal points from the arguments or the configuration file.
+
+    Args:
+        args (argparse.Namespace): Parsed arguments.
+
+    Returns:
+        tuple: The (start, goal) points as tuples.
+    """
+    start, goal = args.start, args.goal
+    if start is None or goal is None:
+        config = _load_config(args.config)
+        start = start or config["start_point"]
+        goal = goal or config["goal_point"]
+    return tuple(start), tuple(goal)
+
+
+def _to_json_path(path):
+    """Convert a path to a JSON serializable list of coordinates."""
+    if path is None:
+        return None
+    return [[float(coord) for coord in node] for node in path]
+
+
+def _write_output(data, output):
+    """Write JSON data to the given file, or to stdout if no file is given."""
+    if output:
+        with open(output, 'w') as file:
+            json.dump(data, file)
+    else:
+        json.dump(data, sys.stdout)
+        sys.stdout.write("\n")
+
+
+def _report_timing(args, stage, started):
+    """Print the elapsed time of a stage to stderr if timing is enabled."""
+    if args.timing:
+        print(f"[timing] {stage}: {(time.perf_counter() - started) * 1000:.1f} ms", file=sys.stderr)
+
+
+def cmd_build(args):
+    """
+    Build a graph from the configuration and cache it on disk.
+
+    Args:
+        args (argparse.Namespace): Parsed arguments.
+    """
+    started = time.perf_counter()
+    from src.graph import Graph
+
+    graph = Graph(config=_load_config(args.config))
+    with open(args.output, 'wb') as file:
+        pickle.dump(graph, file, protocol=pickle.HIGHEST_PROTOCOL)
+    _report_timing(args, "build", started)
+    print(f"Graph with {len(graph.nodes)} nodes written to {args.output}", file=sys.stderr)
+
+
+def cmd_plan(args):
+    """
+    Plan a single query, or a batch of queries read from a JSON file.
+
+    The batch file contains a list of objects with 'start' and 'goal' keys.
+
+    Args:
+        args (argparse.Namespace): Parsed arguments.
+    """
+    started = time.perf_counter()
+    graph = _load_graph(args)
+    planner = _create_planner(args.planner, graph)
+    _report_timing(args, "load", started)
+
+    started = time.perf_counter()
+    if args.queries:
+        with open(args.queries, 'r') as file:
+            queries = json.load(file)
+        result = [
+            {
+                "start": query["start"],
+                "goal": query["goal"],
+                "path": _to_json_path(_plan(planner, args, tuple(query["start"]), tuple(query["goal"])))
+            }
+            for query in queries
+        ]
+    else:
+        start, goal = _resolve_endpoints(args)
+        result = _to_json_path(_plan(planner, args, start, goal))
+    _report_timing(args, "plan", started)
+
+    _write_output(result, args.output)
+
+
+def cmd_render(args):
+    """
+    Plan a path and render it with the 2D or 3D visualizer.
+
+    Args:
+        args (argparse.Namespace): Parsed arguments.
+    """
+    graph = _load_graph(args)
+    planner = _create_planner(args.planner, graph)
+    start, goal = _resolve_endpoints(args)
+    path = _plan(planner, args, start, goal)
+    if path is None:
+        raise SystemExit("No path found between start and goal!")
+
+    if args.output:
+        import matplotlib
+        matplotlib.use("Agg")
+    from src.visualizer import Visualizer2D, Visualizer3D
+
+    visualizer_class = Visualizer2D if args.view == "2d" else Visualizer3D
+    visualizer_class(graph=graph, path=path).plot(save_path=args.output)
+
+
+def build_parser():
+    """
+    Create the command-line argument parser.
+
+    Returns:
+        argparse.ArgumentParser: The parser with the build, plan and render subcommands.
+    """
+    parser = argparse.ArgumentParser(prog="robot-path-planner", description="3D robot path planner.")
+    parser.add_argument("--timing", action="store_true", help="Print stage timings to stderr.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    def add_source_arguments(subparser):
+        subparser.add_argument("--config", default=DEFAULT_CONFIG, help="Path to the JSON configuration file.")
+        subparser.add_argument("--graph", help="Path to a cached graph created with 'build'.")
+        subparser.add_argument("--planner", choices=sorted(PLANNERS), default="dijkstra")
+        subparser.add_argument("--start", type=float, nargs=3, metavar=("X", "Y", "Z"))
+        subparser.add_argument("--goal", type=float, nargs=3, metavar=("X", "Y", "Z"))
+        subparser.add_argument("--time-budget", type=float, metavar="SECONDS",
+                               help="Time budget of the anytime planner.")
+        subparser.add_argument("--max-expansions", type=int,
+                               help="Node expansion budget of the anytime planner.")
+
+    build = subparsers.add_parser("build", help="Build a graph and cache it on disk.")
+    build.add_argument("--config", default=DEFAULT_CONFIG, help="Path to the JSON configuration file.")
+    build.add_argument("--output", required=True, help="Path of the cached graph file.")
+    build.set_defaults(func=cmd_build)
+
+    plan = subparsers.add_parser("plan", help="Plan one query or a batch of queries.")
+    add_source_arguments(plan)
+    plan.add_argument("--queries", help="JSON file with a list of {'start': [...], 'goal': [...]} queries.")
+    plan.add_argument("--output", help="Write the resulting path(s) as JSON to this file.")
+    plan.set_defaults(func=cmd_plan)
+
+    render = subparsers.add_parser("render", help="Plan a path and visualize it.")
+    add_source_arguments(render)
+    render.add_argument("--view", choices=["2d", "3d"], default="3d")
+    render.add_argument("--output", help="Save the figure to this file instead of showing it.")
+    render.set_defaults(func=cmd_render)
+
+    return parser
+
+
+def main(argv=None):
+    """
+    Run the command-line interface.
+
+    Args:
+        argv (list): The command-line arguments, defaults to `sys.argv[1:]`.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    # The build subcommand has no planner or budget arguments
+    budget = (getattr(args, "time_budget", None), getattr(args, "max_expansions", None))
+    if any(value is not None for value in budget) and args.planner != "anytime":
+        parser.error("--time-budget and --max-expansions require --planner anytime")
+    args.func(args)
@@ -16,6 +16,7 @@ class Graph:
         obstacles (list): A list of obstacles, each defined by 'start' and 'end' coordinates.
         nodes (set): A set of all valid nodes in the graph.
         edges (dict): A dictionary mapping each node to its connected neighbors and weights.
+        grid_shape (tuple): The number of grid points along each axis.
     """
 
     def __init__(self, config):
@@ -33,6 +34,7 @@ class Graph:
 
         self.nodes = set()
         self.edges = defaultdict(list)
+        self.grid_shape = (0, 0, 0)
 
         self._create_grid()
         self._remove_obstacle_nodes()
@@ -47,6 +49,7 @@ class Graph:
         x_range = np.arange(0, self.space_size[0] + self.grid_resolution, self.grid_resolution)
         y_range = np.arange(0, self.space_size[1] + self.grid_resolution, self.grid_resolution)
         z_range = np.arange(0, self.space_size[2] + self.grid_resolution, self.grid_resolution)
+        self.grid_shape = (len(x_range), len(y_range), len(z_range))
 
         for x in x_range:
             for y in y_range:
@@ -144,6 +147,131 @@ class Graph:
         diff = [abs(node[i] - neighbor[i]) for i in range(3)]
         return diff.count(0) == 2
 
+    def nearest_free_node(self, point, max_radius=None):
+        """
+        Find the free graph node closest to an arbitrary point.
+
+        The point is mapped to its grid cell with constant-time arithmetic. If that
+        node is blocked by an obstacle, cubic shells of growing radius around it are
+        searched until the closest free node is certain.
+
+        Args:
+            point (tuple): The point coordinates (x, y, z).
+            max_radius (int): Maximum number of grid cells to search outward, or None for no limit.
+
+        Returns:
+            tuple: The closest free node (x, y, z).
+
+        Raises:
+            ValueError: If no free node is found within `max_radius` cells.
+        """
+        index = tuple(
+            min(max(int(round(point[i] / self.grid_resolution)), 0), self.grid_shape[i] - 1)
+            for i in range(3)
+        )
+        return self._search_free_node(point, index, max_radius)
+
+    def nearest_free_nodes(self, points, max_radius=None):
+        """
+        Find the closest free graph node for each point of a batch.
+
+        Args:
+            points (list): A list or (N, 3) array of point coordinates.
+            max_radius (int): Maximum number of grid cells to search outward, or None for no limit.
+
+        Returns:
+            list: The closest free node for each point, in the same order.
+
+        Raises:
+            ValueError: If no free node is found within `max_radius` cells of a point.
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        indices = np.clip(np.rint(points / self.grid_resolution), 0, np.array(self.grid_shape) - 1).astype(int)
+        return [
+            self._search_free_node(tuple(point), tuple(index), max_radius)
+            for point, index in zip(points.tolist(), indices.tolist())
+        ]
+
+    def _node_at(self, index):
+        """
+        Get the node coordinates of a grid index.
+
+        Args:
+            index (tuple): The grid index (i, j, k).
+
+        Returns:
+            tuple: The node coordinates (x, y, z), rounded like the grid nodes.
+        """
+        return tuple(round(index[i] * self.grid_resolution, 5) for i in range(3))
+
+    def _search_free_node(self, point, index, max_radius=None):
+        """
+        Search outward from a grid index for the free node closest to a point.
+
+        A node on the shell of radius r is at least (r - 0.5) * grid_resolution away
+        from the point, so the search stops as soon as no closer node can exist.
+
+        Args:
+            point (tuple): The point coordinates (x, y, z).
+            index (tuple): The grid index of the cell containing the point.
+            max_radius (int): Maximum number of grid cells to search outward, or None for no limit.
+
+        Returns:
+            tuple: The closest free node (x, y, z).
+
+        Raises:
+            ValueError: If no free node is found within `max_radius` cells.
+        """
+        node = self._node_at(index)
+        if node in self.nodes:
+            return node
+
+        limit = max(self.grid_shape) if max_radius is None else max_radius
+        best, best_distance = None, float('inf')
+        for radius in range(1, limit + 1):
+            if best is not None and ((radius - 0.5) * self.grid_resolution) ** 2 >= best_distance:
+                break
+            for candidate_index in self._shell_indices(index, radius):
+                candidate = self._node_at(candidate_index)
+                if candidate in self.nodes:
+                    distance = sum((candidate[i] - point[i]) ** 2 for i in range(3))
+                    if distance < best_distance:
+                        best, best_distance = candidate, distance
+
+        if best is None:
+            raise ValueError(f"No free node within {limit} cells of point {tuple(point)}!")
+        return best
+
+    def _shell_indices(self, index, radius):
+        """
+        Generate the grid indices on the surface of a cube around an index.
+
+        Args:
+            index (tuple): The grid index at the center of the cube.
+            radius (int): The Chebyshev radius of the cube in grid cells.
+
+        Yields:
+            tuple: Grid indices (i, j, k) inside the grid at exactly `radius` cells.
+        """
+        i0, j0, k0 = index
+        nx, ny, nz = self.grid_shape
+        for di in range(-radius, radius + 1):
+            i = i0 + di
+            if not 0 <= i < nx:
+                continue
+            for dj in range(-radius, radius + 1):
+                j = j0 + dj
+                if not 0 <= j < ny:
+                    continue
+                if abs(di) == radius or abs(dj) == radius:
+                    dk_values = range(-radius, radius + 1)
+                else:
+                    dk_values = (-radius, radius)
+                for dk in dk_values:
+                    k = k0 + dk
+                    if 0 <= k < nz:
+                        yield i, j, k
+
     def print_graph(self):
         """
         Print the graph structure.
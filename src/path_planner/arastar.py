@@ -0,0 +1,170 @@
+import heapq
+import time
+from collections import namedtuple
+
+from src.path_planner.astar import AStarPathPlanner
+
+
+AnytimeSolution = namedtuple("AnytimeSolution", ["path", "cost", "epsilon"])
+
+
+class AnytimeAStarPathPlanner(AStarPathPlanner):
+    """
+    Anytime Repairing A* (ARA*) path planner with a time or expansion budget.
+
+    The planner first runs A* with a heuristic inflated by `initial_epsilon`,
+    which finds a (possibly suboptimal) path quickly. It then lowers the inflation
+    step by step and reuses the previous search effort to improve the path, until
+    either the solution is proven optimal or the budget is exhausted.
+
+    Attributes:
+        graph (Graph): The graph on which the path planning is performed.
+        initial_epsilon (float): Heuristic inflation factor for the first search.
+        epsilon_step (float): Amount the inflation factor is lowered after each search.
+    """
+
+    def __init__(self, graph, initial_epsilon=3.0, epsilon_step=0.5):
+        """
+        Initialize the AnytimeAStarPathPlanner with a graph and inflation schedule.
+
+        Args:
+            graph (Graph): The graph object containing nodes and edges.
+            initial_epsilon (float): Heuristic inflation factor for the first search (>= 1).
+            epsilon_step (float): Amount the inflation factor is lowered after each search (> 0).
+
+        Raises:
+            ValueError: If the inflation schedule is invalid.
+        """
+        super().__init__(graph)
+        if initial_epsilon < 1:
+            raise ValueError("The 'initial_epsilon' must be at least 1!")
+        if epsilon_step <= 0:
+            raise ValueError("The 'epsilon_step' must be positive!")
+        self.initial_epsilon = initial_epsilon
+        self.epsilon_step = epsilon_step
+
+    def plan_path(self, start, goal, time_budget=None, max_expansions=None):
+        """
+        Plan a path and return the best solution found within the budget.
+
+        Args:
+            start (tuple): The starting point's coordinates (x, y, z).
+            goal (tuple): The goal point's coordinates (x, y, z).
+            time_budget (float): Wall-clock budget in seconds, or None for no limit.
+            max_expansions (int): Maximum number of node expansions, or None for no limit.
+
+        Returns:
+            list: The best path found as a list of nodes from start to goal.
+            None: If no path was found within the budget.
+        """
+        best = None
+        for solution in self.iter_solutions(start, goal, time_budget=time_budget, max_expansions=max_expansions):
+            best = solution
+        return best.path if best is not None else None
+
+    def iter_solutions(self, start, goal, time_budget=None, max_expansions=None):
+        """
+        Yield successively better solutions until the budget runs out.
+
+        Start and goal points are snapped to the nearest free nodes. A solution is
+        yielded whenever its cost or its suboptimality bound improves.
+        The last yielded solution has `epsilon == 1.0` if the search finished and
+        proved it optimal.
+
+        Args:
+            start (tuple): The starting point's coordinates (x, y, z).
+            goal (tuple): The goal point's coordinates (x, y, z).
+            time_budget (float): Wall-clock budget in seconds, or None for no limit.
+            max_expansions (int): Maximum number of node expansions, or None for no limit.
+
+        Yields:
+            AnytimeSolution: Named tuple of (path, cost, epsilon), where the path cost
+            is guaranteed to be at most `epsilon` times the optimal cost.
+
+        Raises:
+            ValueError: If no free node is found near the start or goal point.
+        """
+        start, goal = self.graph.nearest_free_nodes([start, goal])
+
+        deadline = time.perf_counter() + time_budget if time_budget is not None else None
+        expansions = 0
+
+        def budget_exhausted():
+            if max_expansions is not None and expansions >= max_expansions:
+                return True
+            return deadline is not None and time.perf_counter() >= deadline
+
+        h_cache = {}
+
+        def h(node):
+            if node not in h_cache:
+                h_cache[node] = self.heuristic(node=node, goal=goal)
+            return h_cache[node]
+
+        g_score = {start: 0}
+        came_from = {}
+        epsilon = self.initial_epsilon
+
+        open_keys = {start: epsilon * h(start)}
+        open_set = [(open_keys[start], start)]
+        closed = set()
+        inconsistent = set()
+
+        best_cost = float('inf')
+        best_bound = float('inf')
+
+        while True:
+            # ImprovePath: expand until the goal's key is the smallest in OPEN
+            while open_set:
+                key, current = open_set[0]
+                if open_keys.get(current) != key:
+                    heapq.heappop(open_set)
+                    continue
+                if g_score.get(goal, float('inf')) <= key:
+                    break
+                if budget_exhausted():
+                    return
+
+                heapq.heappop(open_set)
+                del open_keys[current]
+                closed.add(current)
+                expansions += 1
+
+                for neighbor, weight in self.graph.edges[current]:
+                    tentative_g_score = g_score[current] + weight
+                    if tentative_g_score < g_score.get(neighbor, float('inf')):
+                        g_score[neighbor] = tentative_g_score
+                        came_from[neighbor] = current
+                        if neighbor in closed:
+                            inconsistent.add(neighbor)
+                        else:
+                            open_keys[neighbor] = tentative_g_score + epsilon * h(neighbor)
+                            heapq.heappush(open_set, (open_keys[neighbor], neighbor))
+
+            goal_cost = g_score.get(goal, float('inf'))
+            if goal_cost == float('inf'):
+                return
+
+            # Suboptimality bound from the unexpanded states (OPEN and INCONS)
+            lower_bound = min(
+                (g_score[node] + h(node) for node in list(open_keys) + list(inconsistent)),
+                default=goal_cost
+            )
+            bound = min(epsilon, goal_cost / lower_bound) if lower_bound > 0 else 1.0
+            bound = max(bound, 1.0)
+
+            if goal_cost < best_cost or bound < best_bound:
+                best_cost = min(best_cost, goal_cost)
+                best_bound = min(best_bound, bound)
+                yield AnytimeSolution(self.reconstruct_path(came_from, goal), goal_cost, bound)
+
+            if bound <= 1.0 or epsilon <= 1.0:
+                return
+
+            # Lower the inflation and reuse the search tree for the next iteration
+            epsilon = max(1.0, epsilon - self.epsilon_step)
+            open_keys = {node: g_score[node] + epsilon * h(node) for node in set(open_keys) | inconsistent}
+            inconsistent = set()
+            open_set = [(key, node) for node, key in open_keys.items()]
+            heapq.heapify(open_set)
+            closed = set()
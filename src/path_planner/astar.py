@@ -12,29 +12,45 @@ class AStarPathPlanner:
         """Calculate Euclidean distance for heuristic."""
         return math.sqrt(sum((node[i] - goal[i]) ** 2 for i in range(3)))
 
-    def plan_path(self, start, goal):
-        """A* algorithm for optimal path."""
+    def plan_path(self, start, goal, on_expand=None):
+        """
+        A* algorithm for optimal path, snapping start and goal to the nearest free nodes.
+
+        `on_expand(node, opened)` is called for every expanded node with the list of
+        neighbors whose score improved, e.g. to record the search with `SearchRecorder`.
+        """
+        start, goal = self.graph.nearest_free_nodes([start, goal])
         open_set = []
         heapq.heappush(open_set, (0, start))
         came_from = {}
-        g_score = {node: float('inf') for node in self.graph.nodes}
-        g_score[start] = 0
-        f_score = {node: float('inf') for node in self.graph.nodes}
-        f_score[start] = self.heuristic(node=start, goal=goal)
+        # Scores are filled in lazily so only visited nodes are touched
+        g_score = {start: 0}
+        f_score = {start: self.heuristic(node=start, goal=goal)}
 
         while open_set:
-            _, current = heapq.heappop(open_set)
+            current_f_score, current = heapq.heappop(open_set)
 
             if current == goal:
+                if on_expand is not None:
+                    on_expand(current, [])
                 return self.reconstruct_path(came_from, current)
 
+            # Skip outdated queue entries of nodes that were reached more cheaply since
+            if current_f_score > f_score[current]:
+                continue
+
+            opened = []
             for neighbor, weight in self.graph.edges[current]:
                 tentative_g_score = g_score[current] + weight
-                if tentative_g_score < g_score[neighbor]:
+                if tentative_g_score < g_score.get(neighbor, float('inf')):
                     came_from[neighbor] = current
                     g_score[neighbor] = tentative_g_score
                     f_score[neighbor] = tentative_g_score + self.heuristic(node=neighbor, goal=goal)
                     heapq.heappush(open_set, (f_score[neighbor], neighbor))
+                    opened.append(neighbor)
+
+            if on_expand is not None:
+                on_expand(current, opened)
 
         return None
 
@@ -20,32 +20,34 @@ class DijkstraPathPlanner:
         """
         self.graph = graph
 
-    def plan_path(self, start, goal):
+    def plan_path(self, start, goal, on_expand=None):
         """
         Plan the shortest path from start to goal using Dijkstra's algorithm.
 
+        Start and goal points that are not graph nodes are snapped to the nearest free node.
+
         Args:
-            start (tuple): The starting node's coordinates (x, y, z).
-            goal (tuple): The goal node's coordinates (x, y, z).
+            start (tuple): The starting point's coordinates (x, y, z).
+            goal (tuple): The goal point's coordinates (x, y, z).
+            on_expand (callable): Optional `on_expand(node, opened)` callback, called for every
+                expanded node with the neighbors whose distance improved.
 
         Returns:
             list: The shortest path as a list of nodes from start to goal.
             None: If no path exists between the start and goal nodes.
 
         Raises:
-            ValueError: If the start or goal node is not in the graph.
+            ValueError: If no free node is found near the start or goal point.
 
         Algorithm:
-            - Initialize distances for all nodes as infinity, except the start node (distance 0).
+            - Initialize the distance of the start node to 0; unvisited nodes are treated as infinity.
             - Use a priority queue to explore the graph in order of increasing distance.
             - Update distances and track the path to each node using a `came_from` dictionary.
             - Stop when the goal node is reached, and reconstruct the path.
         """
-        if start not in self.graph.nodes or goal not in self.graph.nodes:
-            raise ValueError("Start or goal node is not in graph!")
+        start, goal = self.graph.nearest_free_nodes([start, goal])
 
-        distances = {node: float('inf') for node in self.graph.nodes}
-        distances[start] = 0
+        distances = {start: 0}
 
         priority_queue = [(0, start)]
 
@@ -55,15 +57,26 @@ class DijkstraPathPlanner:
             current_distance, current_node = heapq.heappop(priority_queue)
 
             if current_node == goal:
+                if on_expand is not None:
+                    on_expand(current_node, [])
                 return self.reconstruct_path(came_from, current_node)
 
+            # Skip outdated queue entries of nodes that were reached more cheaply since
+            if current_distance > distances[current_node]:
+                continue
+
+            opened = []
             for neighbor, weight in self.graph.edges[current_node]:
                 new_distance = current_distance + weight
 
-                if new_distance < distances[neighbor]:
+                if new_distance < distances.get(neighbor, float('inf')):
                     distances[neighbor] = new_distance
                     came_from[neighbor] = current_node
                     heapq.heappush(priority_queue, (new_distance, neighbor))
+                    opened.append(neighbor)
+
+            if on_expand is not None:
+                on_expand(current_node, opened)
 
         return None
 
@@ -0,0 +1,230 @@
+import heapq
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+MissionPlan = namedtuple("MissionPlan", ["order", "cost", "path", "cost_matrix"])
+
+# Graph shared with the worker processes of a parallel cost matrix computation
+_worker_graph = None
+
+
+def _init_worker(graph):
+    """Store the graph in a worker process."""
+    global _worker_graph
+    _worker_graph = graph
+
+
+def _search_from_worker(task):
+    """Run a multi-target search in a worker process on the shared graph."""
+    source, targets = task
+    return multi_target_search(_worker_graph, source, targets)
+
+
+def multi_target_search(graph, source, targets):
+    """
+    Find the shortest paths from one source to several targets with a single Dijkstra search.
+
+    The search stops as soon as every target is settled.
+
+    Args:
+        graph (Graph): The graph on which the search is performed.
+        source (tuple): The source node coordinates (x, y, z).
+        targets (list): The target nodes.
+
+    Returns:
+        tuple: A list of path costs and a list of paths, in the order of `targets`.
+        Unreachable targets have an infinite cost and a None path.
+    """
+    remaining = set(targets)
+    distances = {source: 0}
+    came_from = {}
+    settled = set()
+    priority_queue = [(0, source)]
+
+    while priority_queue and remaining:
+        current_distance, current_node = heapq.heappop(priority_queue)
+        if current_node in settled:
+            continue
+        settled.add(current_node)
+        remaining.discard(current_node)
+
+        for neighbor, weight in graph.edges[current_node]:
+            new_distance = current_distance + weight
+            if new_distance < distances.get(neighbor, float('inf')):
+                distances[neighbor] = new_distance
+                came_from[neighbor] = current_node
+                heapq.heappush(priority_queue, (new_distance, neighbor))
+
+    costs, paths = [], []
+    for target in targets:
+        if target in settled:
+            path = [target]
+            while path[-1] in came_from:
+                path.append(came_from[path[-1]])
+            costs.append(distances[target])
+            paths.append(path[::-1])
+        else:
+            costs.append(float('inf'))
+            paths.append(None)
+    return costs, paths
+
+
+class MissionPlanner:
+    """
+    Plans multi-stop missions through a set of waypoints.
+
+    The planner computes the pairwise path costs between all waypoints with one
+    multi-target search per waypoint, finds a short visit order with a nearest
+    neighbour tour improved by 2-opt, and stitches the paths together.
+
+    Attributes:
+        graph (Graph): The graph on which the path planning is performed.
+    """
+
+    def __init__(self, graph):
+        """
+        Initialize the MissionPlanner with a graph.
+
+        Args:
+            graph (Graph): The graph object containing nodes and edges.
+        """
+        self.graph = graph
+
+    def cost_matrix(self, waypoints, workers=1):
+        """
+        Compute the pairwise path costs and paths between waypoints.
+
+        Waypoints are snapped to the nearest free nodes.
+
+        Args:
+            waypoints (list): The waypoint coordinates (x, y, z).
+            workers (int): The number of worker processes, 1 runs the searches in this process.
+
+        Returns:
+            tuple: An (N, N) array of path costs (inf if unreachable), and a nested list
+            where `paths[i][j]` is the path from waypoint i to waypoint j.
+        """
+        nodes = self.graph.nearest_free_nodes(waypoints)
+        tasks = [(node, nodes) for node in nodes]
+
+        if workers == 1:
+            results = [multi_target_search(self.graph, source, targets) for source, targets in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self.graph,)) as executor:
+                results = list(executor.map(_search_from_worker, tasks))
+
+        matrix = np.array([costs for costs, _ in results], dtype=float)
+        paths = [row_paths for _, row_paths in results]
+        return matrix, paths
+
+    def plan_mission(self, waypoints, return_to_start=False, workers=1):
+        """
+        Plan a mission that starts at the first waypoint and visits all others.
+
+        Args:
+            waypoints (list): The waypoint coordinates (x, y, z), the first one is the start.
+            return_to_start (bool): Whether the mission ends back at the first waypoint.
+            workers (int): The number of worker processes for the cost matrix.
+
+        Returns:
+            MissionPlan: Named tuple of (order, cost, path, cost_matrix), where `order` lists
+            waypoint indices in visiting order and `path` is the stitched path, or None
+            if some waypoints cannot be reached.
+
+        Raises:
+            ValueError: If no waypoints are given.
+        """
+        if not waypoints:
+            raise ValueError("At least one waypoint is required!")
+
+        matrix, paths = self.cost_matrix(waypoints, workers=workers)
+        order = self.two_opt(matrix, self.nearest_neighbour_order(matrix), return_to_start)
+        cost = self.order_cost(matrix, order, return_to_start)
+
+        if cost == float('inf'):
+            return MissionPlan(order, cost, None, matrix)
+
+        stops = order + [order[0]] if return_to_start else order
+        path = list(paths[stops[0]][stops[0]])
+        for current, following in zip(stops, stops[1:]):
+            path.extend(paths[current][following][1:])
+        return MissionPlan(order, float(cost), path, matrix)
+
+    @staticmethod
+    def nearest_neighbour_order(matrix):
+        """
+        Build a visit order that always moves to the closest unvisited waypoint.
+
+        Args:
+            matrix (numpy.ndarray): The (N, N) cost matrix.
+
+        Returns:
+            list: Waypoint indices in visiting order, starting with 0.
+        """
+        order = [0]
+        unvisited = set(range(1, len(matrix)))
+        while unvisited:
+            closest = min(unvisited, key=lambda index: matrix[order[-1], index])
+            order.append(closest)
+            unvisited.remove(closest)
+        return order
+
+    @staticmethod
+    def order_cost(matrix, order, return_to_start=False):
+        """
+        Calculate the total cost of visiting waypoints in an order.
+
+        Args:
+            matrix (numpy.ndarray): The (N, N) cost matrix.
+            order (list): Waypoint indices in visiting order.
+            return_to_start (bool): Whether the mission ends back at the first waypoint.
+
+        Returns:
+            float: The total path cost.
+        """
+        stops = order + [order[0]] if return_to_start else order
+        return sum(matrix[current, following] for current, following in zip(stops, stops[1:]))
+
+    @staticmethod
+    def two_opt(matrix, order, return_to_start=False):
+        """
+        Improve a visit order by reversing segments while that shortens it.
+
+        The first waypoint stays fixed as the start of the mission.
+
+        Args:
+            matrix (numpy.ndarray): The (N, N) cost matrix, assumed symmetric.
+            order (list): The initial waypoint indices in visiting order.
+            return_to_start (bool): Whether the mission ends back at the first waypoint.
+
+        Returns:
+            list: The improved visiting order.
+        """
+        order = list(order)
+        count = len(order)
+        improved = True
+        while improved:
+            improved = False
+            for i in range(1, count - 1):
+                for j in range(i + 1, count):
+                    before, first, last = order[i - 1], order[i], order[j]
+                    if j + 1 < count:
+                        after = order[j + 1]
+                    elif return_to_start:
+                        after = order[0]
+                    else:
+                        after = None
+
+                    old_cost = matrix[before, first]
+                    new_cost = matrix[before, last]
+                    if after is not None:
+                        old_cost += matrix[last, after]
+                        new_cost += matrix[first, after]
+
+                    if new_cost < old_cost - 1e-12:
+                        order[i:j + 1] = reversed(order[i:j + 1])
+                        improved = True
+        return order
@@ -0,0 +1,213 @@
+import heapq
+
+from src.path_planner.astar import AStarPathPlanner
+
+
+class ReservationTable:
+    """
+    Hashed space-time reservation table for multi-robot planning.
+
+    Time is discrete: a robot occupies one node per time step and moves to a
+    neighboring node (or waits) between steps.
+
+    Attributes:
+        vertices (dict): Maps (node, time) to the robot occupying the node at that time.
+        midpoints (dict): Maps (midpoint key, time) to the robot whose move starting at that time
+            passes through the midpoint. Swaps and crossing diagonal moves share a midpoint.
+        parked (dict): Maps goal nodes to (arrival_time, robot) for robots that stay there.
+        last_time (dict): Maps each node to the last time step it is reserved.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty reservation table.
+        """
+        self.vertices = {}
+        self.midpoints = {}
+        self.parked = {}
+        self.last_time = {}
+
+    def reserve_path(self, path, robot):
+        """
+        Reserve a timed path, and park the robot at its last node afterwards.
+
+        Args:
+            path (list): The node occupied at each time step.
+            robot (int): The identifier of the robot following the path.
+        """
+        for time_step, node in enumerate(path):
+            self.vertices[(node, time_step)] = robot
+            self.last_time[node] = max(self.last_time.get(node, -1), time_step)
+            if time_step > 0 and path[time_step - 1] != node:
+                self.midpoints[(self._midpoint(path[time_step - 1], node), time_step - 1)] = robot
+        self.parked[path[-1]] = (len(path) - 1, robot)
+
+    def is_free(self, node, time_step):
+        """
+        Check whether a node is free at a time step.
+
+        Args:
+            node (tuple): The node coordinates (x, y, z).
+            time_step (int): The time step.
+
+        Returns:
+            bool: True if no robot occupies or is parked at the node.
+        """
+        if (node, time_step) in self.vertices:
+            return False
+        parked = self.parked.get(node)
+        return parked is None or time_step < parked[0]
+
+    @staticmethod
+    def _midpoint(node, neighbor):
+        """
+        Get a key for the midpoint of a move between two nodes.
+
+        The key is the coordinate sum (twice the midpoint). Crossing moves add up the same
+        pair of values on every axis, so their keys are exactly equal without rounding.
+        """
+        return node[0] + neighbor[0], node[1] + neighbor[1], node[2] + neighbor[2]
+
+    def is_move_free(self, node, neighbor, time_step):
+        """
+        Check that a move does not cross the move of another robot.
+
+        On the grid, two moves that swap places or cross diagonally within the same
+        cell meet at their common midpoint, so reserved midpoints catch both.
+
+        Args:
+            node (tuple): The node the move starts from.
+            neighbor (tuple): The node the move ends at.
+            time_step (int): The time step at which the move starts.
+
+        Returns:
+            bool: True if no robot passes through the midpoint of the move at that time.
+        """
+        if node == neighbor:
+            return True
+        return (self._midpoint(node, neighbor), time_step) not in self.midpoints
+
+    def can_stay(self, node, time_step):
+        """
+        Check whether a robot arriving at a node at a time step can stay there forever.
+
+        Args:
+            node (tuple): The node coordinates (x, y, z).
+            time_step (int): The arrival time step.
+
+        Returns:
+            bool: True if the node is never reserved at or after the time step.
+        """
+        return node not in self.parked and self.last_time.get(node, -1) < time_step
+
+
+class PrioritizedPathPlanner(AStarPathPlanner):
+    """
+    Prioritized multi-robot planner built on space-time A*.
+
+    Robots are planned one after another in priority order. Each robot runs A*
+    over (node, time) states, avoiding the nodes and moves reserved by the robots
+    planned before it, and then reserves its own path.
+
+    Attributes:
+        graph (Graph): The graph on which the path planning is performed.
+        wait_cost (float): The cost of waiting in place for one time step.
+    """
+
+    def __init__(self, graph, wait_cost=None):
+        """
+        Initialize the PrioritizedPathPlanner with a graph.
+
+        Args:
+            graph (Graph): The graph object containing nodes and edges.
+            wait_cost (float): The cost of waiting for one time step, defaults to the grid resolution.
+        """
+        super().__init__(graph)
+        self.wait_cost = graph.grid_resolution if wait_cost is None else wait_cost
+
+    def plan_paths(self, tasks, reservations=None, max_time=None):
+        """
+        Plan collision-free paths for several robots in priority order.
+
+        Args:
+            tasks (list): A list of (start, goal) points, highest priority first.
+            reservations (ReservationTable): Existing reservations to respect, updated in place.
+            max_time (int): The time horizon of each search, see `plan_timed_path` for the default.
+
+        Returns:
+            list: For each robot, the node occupied at each time step, or None if no path was found.
+        """
+        if reservations is None:
+            reservations = ReservationTable()
+
+        paths = []
+        for robot, (start, goal) in enumerate(tasks):
+            path = self.plan_timed_path(start, goal, reservations, max_time=max_time)
+            if path is not None:
+                reservations.reserve_path(path, robot)
+            paths.append(path)
+        return paths
+
+    def plan_timed_path(self, start, goal, reservations, max_time=None):
+        """
+        Space-time A* for a single robot against a reservation table.
+
+        Args:
+            start (tuple): The starting point's coordinates (x, y, z).
+            goal (tuple): The goal point's coordinates (x, y, z).
+            reservations (ReservationTable): The reservations of higher priority robots.
+            max_time (int): The time horizon of the search. Defaults to twice the number of moves
+                of the single-robot path plus the last reserved time step.
+
+        Returns:
+            list: The node occupied at each time step from start to goal.
+            None: If the start is occupied at time 0, the goal is taken by a parked robot,
+            the goal is unreachable, or no collision-free path exists within the time horizon.
+        """
+        start, goal = self.graph.nearest_free_nodes([start, goal])
+        if not reservations.is_free(start, 0) or goal in reservations.parked:
+            return None
+
+        # A plain A* search rules out unreachable goals before the space-time search
+        single_path = self.plan_path(start, goal)
+        if single_path is None:
+            return None
+        if max_time is None:
+            max_time = 2 * (len(single_path) - 1) + max(reservations.last_time.values(), default=0)
+
+        start_state = (start, 0)
+        open_set = [(self.heuristic(node=start, goal=goal), 0, start_state)]
+        came_from = {}
+        g_score = {start_state: 0}
+        closed = set()
+
+        while open_set:
+            _, g, state = heapq.heappop(open_set)
+            if state in closed:
+                continue
+            closed.add(state)
+
+            node, time_step = state
+            if node == goal and reservations.can_stay(node, time_step):
+                return [node for node, _ in self.reconstruct_path(came_from, state)]
+            if time_step >= max_time:
+                continue
+
+            next_time = time_step + 1
+            moves = [(node, self.wait_cost)] + self.graph.edges[node]
+            for neighbor, weight in moves:
+                next_state = (neighbor, next_time)
+                if next_state in closed:
+                    continue
+                if not reservations.is_free(neighbor, next_time):
+                    continue
+                if not reservations.is_move_free(node, neighbor, time_step):
+                    continue
+                tentative_g_score = g + weight
+                if tentative_g_score < g_score.get(next_state, float('inf')):
+                    g_score[next_state] = tentative_g_score
+                    came_from[next_state] = state
+                    f_score = tentative_g_score + self.heuristic(node=neighbor, goal=goal)
+                    heapq.heappush(open_set, (f_score, tentative_g_score, next_state))
+
+        return None
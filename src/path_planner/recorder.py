@@ -0,0 +1,65 @@
+class SearchRecorder:
+    """
+    Records the expansion events of a path planner search.
+
+    An instance is passed as the `on_expand` callback of `plan_path`. Each event
+    stores the expanded node and the neighbors it opened, which is enough to
+    replay the closed set, the frontier and the current best path at any step.
+
+    Attributes:
+        events (list): The (expanded_node, opened_neighbors) tuples in expansion order.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty recorder.
+        """
+        self.events = []
+
+    def __call__(self, node, opened):
+        """
+        Record one expansion event.
+
+        Args:
+            node (tuple): The expanded node coordinates (x, y, z).
+            opened (list): The neighbors whose score improved through the expanded node.
+        """
+        self.events.append((node, tuple(opened)))
+
+    def __len__(self):
+        return len(self.events)
+
+    def replay(self, steps_per_frame=1):
+        """
+        Replay the search state frame by frame.
+
+        Args:
+            steps_per_frame (int): The number of expansion events applied per frame.
+
+        Yields:
+            tuple: (closed_count, frontier, path) after each frame, where `closed_count`
+            is the number of expanded nodes so far (the closed set is the prefix of the
+            expanded nodes), `frontier` is a frozenset of the opened but unexpanded nodes and
+            `path` is the path to the last expanded node.
+        """
+        came_from = {}
+        frontier = set()
+        expanded = 0
+
+        for frame_start in range(0, len(self.events), steps_per_frame):
+            for node, opened in self.events[frame_start:frame_start + steps_per_frame]:
+                frontier.discard(node)
+                expanded += 1
+                for neighbor in opened:
+                    came_from[neighbor] = node
+                    frontier.add(neighbor)
+
+            path = [node]
+            while path[-1] in came_from and len(path) <= len(came_from):
+                path.append(came_from[path[-1]])
+            yield expanded, frozenset(frontier), path[::-1]
+
+    @property
+    def expanded_nodes(self):
+        """The expanded nodes in expansion order."""
+        return [node for node, _ in self.events]
@@ -0,0 +1,304 @@
+import itertools
+import json
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from src.graph import Graph
+
+
+META_FILE = "meta.json"
+
+
+def _chunk_file(directory, chunk):
+    """Get the path of the occupancy file of a chunk."""
+    return os.path.join(directory, "chunk_{}_{}_{}.npy".format(*chunk))
+
+
+def _build_chunk(task):
+    """
+    Compute the free-node mask of one chunk and store it on disk.
+
+    Chunks without any obstacle node are not written, a missing file means "all free".
+
+    Args:
+        task (tuple): (directory, chunk, chunk_size, grid_shape, grid_resolution, obstacles).
+
+    Returns:
+        tuple: The chunk index, its number of free nodes and whether a file was written.
+    """
+    directory, chunk, chunk_size, grid_shape, grid_resolution, obstacles = task
+
+    # Coordinates are rounded the same way as the nodes of Graph
+    axes = []
+    for axis in range(3):
+        first = chunk[axis] * chunk_size
+        last = min(first + chunk_size, grid_shape[axis])
+        axes.append(np.array([round(i * grid_resolution, 5) for i in range(first, last)]))
+
+    free = np.ones(tuple(len(values) for values in axes), dtype=bool)
+    for obstacle in obstacles:
+        inside = [(obstacle['start'][i] <= axes[i]) & (axes[i] <= obstacle['end'][i]) for i in range(3)]
+        free &= ~(inside[0][:, None, None] & inside[1][None, :, None] & inside[2][None, None, :])
+
+    stored = not free.all()
+    if stored:
+        np.save(_chunk_file(directory, chunk), free)
+    return chunk, int(free.sum()), stored
+
+
+def build_tiled_map(config, directory, chunk_size=32, workers=None):
+    """
+    Split the grid of a configuration into chunks and store them on disk.
+
+    Chunks are built in parallel worker processes.
+
+    Args:
+        config (dict): Configuration containing 'space_size', 'grid_resolution', and 'obstacles'.
+        directory (str): The directory the tiled map is written to.
+        chunk_size (int): The number of grid points along each axis of a chunk.
+        workers (int): The number of worker processes, defaults to the number of CPUs.
+
+    Returns:
+        str: The directory of the tiled map.
+
+    Raises:
+        ValueError: If the chunk size is not positive.
+    """
+    if chunk_size <= 0:
+        raise ValueError("The 'chunk_size' must be positive!")
+
+    resolution = config['grid_resolution']
+    grid_shape = tuple(
+        len(np.arange(0, config['space_size'][i] + resolution, resolution)) for i in range(3)
+    )
+    chunk_counts = tuple(-(-size // chunk_size) for size in grid_shape)
+
+    os.makedirs(directory, exist_ok=True)
+    tasks = [
+        (directory, chunk, chunk_size, grid_shape, resolution, config['obstacles'])
+        for chunk in itertools.product(*(range(count) for count in chunk_counts))
+    ]
+    if workers == 1:
+        results = list(map(_build_chunk, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_build_chunk, tasks, chunksize=max(1, len(tasks) // 64)))
+
+    meta = {
+        "space_size": config['space_size'],
+        "grid_resolution": resolution,
+        "obstacles": config['obstacles'],
+        "grid_shape": grid_shape,
+        "chunk_size": chunk_size,
+        "free_nodes": sum(count for _, count, _ in results),
+        "stored_chunks": [chunk for chunk, _, stored in results if stored]
+    }
+    with open(os.path.join(directory, META_FILE), 'w') as file:
+        json.dump(meta, file)
+    return directory
+
+
+class _TiledNodes:
+    """
+    Read-only set-like view of the free nodes of a tiled graph.
+    """
+
+    def __init__(self, graph):
+        self._graph = graph
+
+    def __contains__(self, node):
+        index = self._graph._index_of(node)
+        return index is not None and self._graph._is_free_index(index)
+
+    def __len__(self):
+        return self._graph.free_nodes
+
+    def __iter__(self):
+        nx, ny, nz = self._graph.grid_shape
+        for index in itertools.product(range(nx), range(ny), range(nz)):
+            if self._graph._is_free_index(index):
+                yield self._graph._node_at(index)
+
+
+class _TiledEdges:
+    """
+    Read-only mapping view computing the edges of a tiled graph node on demand.
+    """
+
+    def __init__(self, graph):
+        self._graph = graph
+
+    def __getitem__(self, node):
+        return self._graph._edges_of(node)
+
+    def __contains__(self, node):
+        return node in self._graph.nodes
+
+    def __iter__(self):
+        return iter(self._graph.nodes)
+
+    def items(self):
+        for node in self._graph.nodes:
+            yield node, self._graph._edges_of(node)
+
+
+class TiledGraph(Graph):
+    """
+    Out-of-core 3D grid graph backed by a tiled map on disk.
+
+    The grid is split into cubic chunks created with `build_tiled_map`. Chunks are
+    loaded lazily as nodes are queried and kept in an LRU cache with a memory cap,
+    and edges are computed on demand. The graph has the same `nodes` and `edges`
+    interface as `Graph`, so the planners can use it unchanged.
+
+    Attributes:
+        directory (str): The directory of the tiled map.
+        chunk_size (int): The number of grid points along each axis of a chunk.
+        max_cache_bytes (int): The memory cap of the chunk cache in bytes.
+        free_nodes (int): The number of free nodes in the graph.
+    """
+
+    def __init__(self, directory, max_cache_bytes=256 * 1024 * 1024):
+        """
+        Open a tiled map created with `build_tiled_map`.
+
+        Args:
+            directory (str): The directory of the tiled map.
+            max_cache_bytes (int): The memory cap of the chunk cache in bytes.
+
+        Raises:
+            FileNotFoundError: If the directory does not contain a tiled map.
+        """
+        meta_path = os.path.join(directory, META_FILE)
+        if not os.path.exists(meta_path):
+            raise FileNotFoundError(f"Tiled map not found: {directory}")
+        with open(meta_path, 'r') as file:
+            meta = json.load(file)
+
+        self.directory = directory
+        self.space_size = meta['space_size']
+        self.grid_resolution = meta['grid_resolution']
+        self.obstacles = meta['obstacles']
+        self.grid_shape = tuple(meta['grid_shape'])
+        self.chunk_size = meta['chunk_size']
+        self.free_nodes = meta['free_nodes']
+        # Chunks without obstacles have no file and are never loaded or cached
+        self._stored_chunks = {tuple(chunk) for chunk in meta['stored_chunks']}
+        self.max_cache_bytes = max_cache_bytes
+
+        self.nodes = _TiledNodes(self)
+        self.edges = _TiledEdges(self)
+
+        self._cache = OrderedDict()
+        self._cache_bytes = 0
+        self._directions = [
+            direction for direction in itertools.product((-1, 0, 1), repeat=3) if direction != (0, 0, 0)
+        ]
+
+    @classmethod
+    def build(cls, config, directory, chunk_size=32, workers=None, max_cache_bytes=256 * 1024 * 1024):
+        """
+        Build a tiled map from a configuration and open it.
+
+        Args:
+            config (dict): Configuration containing 'space_size', 'grid_resolution', and 'obstacles'.
+            directory (str): The directory the tiled map is written to.
+            chunk_size (int): The number of grid points along each axis of a chunk.
+            workers (int): The number of worker processes, defaults to the number of CPUs.
+            max_cache_bytes (int): The memory cap of the chunk cache in bytes.
+
+        Returns:
+            TiledGraph: The opened tiled graph.
+        """
+        build_tiled_map(config, directory, chunk_size=chunk_size, workers=workers)
+        return cls(directory, max_cache_bytes=max_cache_bytes)
+
+    @property
+    def cached_chunks(self):
+        """The chunk indices currently held in memory, least recently used first."""
+        return list(self._cache)
+
+    def _index_of(self, node):
+        """
+        Get the grid index of a node, or None if it is not a grid point.
+
+        Args:
+            node (tuple): The node coordinates (x, y, z).
+
+        Returns:
+            tuple: The grid index (i, j, k), or None.
+        """
+        index = tuple(int(round(node[i] / self.grid_resolution)) for i in range(3))
+        if not all(0 <= index[i] < self.grid_shape[i] for i in range(3)):
+            return None
+        if self._node_at(index) != tuple(round(coord, 5) for coord in node):
+            return None
+        return index
+
+    def _load_chunk(self, chunk):
+        """
+        Get the free-node mask of a chunk, loading it from disk if needed.
+
+        Args:
+            chunk (tuple): The chunk index.
+
+        Returns:
+            numpy.ndarray: The boolean free-node mask, or None if the chunk is entirely free.
+        """
+        if chunk not in self._stored_chunks:
+            return None
+        if chunk in self._cache:
+            self._cache.move_to_end(chunk)
+            return self._cache[chunk]
+
+        mask = np.load(_chunk_file(self.directory, chunk))
+        self._cache[chunk] = mask
+        self._cache_bytes += mask.nbytes
+
+        # Evict least recently used chunks, but always keep the one just loaded
+        while self._cache_bytes > self.max_cache_bytes and len(self._cache) > 1:
+            _, evicted = self._cache.popitem(last=False)
+            self._cache_bytes -= evicted.nbytes
+        return mask
+
+    def _is_free_index(self, index):
+        """
+        Check whether the node at a grid index is free.
+
+        Args:
+            index (tuple): The grid index (i, j, k).
+
+        Returns:
+            bool: True if the node exists and is not inside an obstacle.
+        """
+        mask = self._load_chunk(tuple(index[i] // self.chunk_size for i in range(3)))
+        if mask is None:
+            return True
+        return bool(mask[index[0] % self.chunk_size, index[1] % self.chunk_size, index[2] % self.chunk_size])
+
+    def _edges_of(self, node):
+        """
+        Compute the connections of a node to its free neighbors.
+
+        Args:
+            node (tuple): The node coordinates (x, y, z).
+
+        Returns:
+            list: A list of (neighbor, weight) tuples.
+        """
+        index = self._index_of(node)
+        if index is None or not self._is_free_index(index):
+            return []
+
+        edges = []
+        for direction in self._directions:
+            neighbor_index = tuple(index[i] + direction[i] for i in range(3))
+            if not all(0 <= neighbor_index[i] < self.grid_shape[i] for i in range(3)):
+                continue
+            if self._is_free_index(neighbor_index):
+                neighbor = self._node_at(neighbor_index)
+                edges.append((neighbor, self._calculate_distance(node, neighbor)))
+        return edges
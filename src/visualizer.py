@@ -1,4 +1,9 @@
+import math
+
 import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.animation import FFMpegWriter, FuncAnimation, PillowWriter
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
 
 
 class Visualizer:
@@ -21,6 +26,20 @@ class Visualizer:
         self.graph = graph
         self.path = path
 
+    @staticmethod
+    def _show(save_path=None):
+        """
+        Show the current figure, or save it to a file.
+
+        Args:
+            save_path (str): Save the figure to this file instead of showing it.
+        """
+        if save_path:
+            plt.savefig(save_path)
+            plt.close()
+        else:
+            plt.show()
+
     def _plot_obstacles_2d(self, ax, plane):
         """
         Plot obstacles in 2D for the given plane.
@@ -66,9 +85,12 @@ class Visualizer2D(Visualizer):
         Visualizer
     """
 
-    def plot(self):
+    def plot(self, save_path=None):
         """
         Plot the graph and path in 2D (top view and side view).
+
+        Args:
+            save_path (str): Save the figure to this file instead of showing it.
         """
         nodes = list(self.graph.nodes)
         edges = self.graph.edges
@@ -103,7 +125,7 @@ class Visualizer2D(Visualizer):
         plt.legend()
 
         plt.tight_layout()
-        plt.show()
+        self._show(save_path)
 
 
 class Visualizer3D(Visualizer):
@@ -114,9 +136,12 @@ class Visualizer3D(Visualizer):
         Visualizer
     """
 
-    def plot(self):
+    def plot(self, save_path=None):
         """
         Plot the graph and path in 3D.
+
+        Args:
+            save_path (str): Save the figure to this file instead of showing it.
         """
         fig = plt.figure(figsize=(10, 7))
         ax = fig.add_subplot(111, projection='3d')
@@ -139,4 +164,126 @@ class Visualizer3D(Visualizer):
         ax.set_ylabel('Y axis')
         ax.set_zlabel('Z axis')
         plt.legend()
-        plt.show()
+        self._show(save_path)
+
+
+class SearchAnimator3D(Visualizer):
+    """
+    3D animation of a recorded path planner search.
+
+    The graph and obstacles are drawn once. Each frame only updates the closed set,
+    the frontier and the path to the last expanded node, and several expansion
+    events are merged into one frame so that long searches stay practical.
+
+    Inherits from:
+        Visualizer
+    """
+
+    def __init__(self, graph, recorder, path=None, steps_per_frame=None, max_frames=300, show_edges=False):
+        """
+        Initialize the SearchAnimator3D with a graph and a recorded search.
+
+        Args:
+            graph (Graph): The graph object.
+            recorder (SearchRecorder): The recorded expansion events of the search.
+            path (list): The final planned path, shown on the last frame.
+            steps_per_frame (int): Expansion events per frame, chosen from `max_frames` if None.
+            max_frames (int): The maximum number of frames when `steps_per_frame` is None.
+            show_edges (bool): Whether to draw the graph edges in the background.
+        """
+        super().__init__(graph, path)
+        self.recorder = recorder
+        self.steps_per_frame = steps_per_frame or max(1, math.ceil(len(recorder) / max_frames))
+        self.show_edges = show_edges
+
+    def _setup_animation(self):
+        """
+        Draw the static background once and create the dynamic artists.
+
+        Returns:
+            tuple: The figure, the frame update function and the number of frames.
+        """
+        fig = plt.figure(figsize=(10, 7))
+        ax = fig.add_subplot(111, projection='3d')
+        ax.set_title("Search")
+        ax.set_xlim(0, self.graph.space_size[0])
+        ax.set_ylim(0, self.graph.space_size[1])
+        ax.set_zlim(0, self.graph.space_size[2])
+        ax.set_xlabel('X axis')
+        ax.set_ylabel('Y axis')
+        ax.set_zlabel('Z axis')
+
+        # Static background, drawn once
+        if self.show_edges:
+            segments = [
+                (node, neighbor) for node, neighbors in self.graph.edges.items() for neighbor, _ in neighbors
+            ]
+            ax.add_collection3d(Line3DCollection(segments, colors='gray', alpha=0.2, linewidths=0.5))
+        self._plot_obstacles_3d(ax)
+
+        # Dynamic artists, updated in place every frame
+        expanded = np.array(self.recorder.expanded_nodes, dtype=float).reshape(-1, 3)
+        closed_artist = ax.scatter([], [], [], color='gray', s=4, alpha=0.4, label="Closed")
+        frontier_artist = ax.scatter([], [], [], color='orange', s=6, label="Frontier")
+        path_artist, = ax.plot([], [], [], 'blue', label="Path")
+        ax.legend(loc='upper left')
+
+        frame_count = math.ceil(len(self.recorder) / self.steps_per_frame)
+
+        def update(frame):
+            frame_index, (closed_count, frontier, path) = frame
+            closed_artist._offsets3d = tuple(expanded[:closed_count].T)
+            frontier_points = np.array(list(frontier), dtype=float).reshape(-1, 3)
+            frontier_artist._offsets3d = tuple(frontier_points.T)
+            if frame_index == frame_count - 1 and self.path:
+                path = self.path
+            path_x, path_y, path_z = zip(*path)
+            path_artist.set_data_3d(path_x, path_y, path_z)
+            return closed_artist, frontier_artist, path_artist
+
+        return fig, update, frame_count
+
+    def animate(self):
+        """
+        Create an interactive animation of the search.
+
+        Returns:
+            matplotlib.animation.FuncAnimation: The animation, one frame per `steps_per_frame` events.
+        """
+        fig, update, frame_count = self._setup_animation()
+        return FuncAnimation(
+            fig, update, frames=enumerate(self.recorder.replay(self.steps_per_frame)),
+            save_count=frame_count, cache_frame_data=False, repeat=False
+        )
+
+    def save(self, file_path, fps=20, dpi=100):
+        """
+        Render the animation offscreen to a GIF or video file.
+
+        Frames are written directly by the movie writer, so each frame is drawn only once.
+
+        Args:
+            file_path (str): The output file, '.gif' uses Pillow, other extensions use FFmpeg.
+            fps (int): Frames per second.
+            dpi (int): Resolution of the frames.
+        """
+        fig, update, _ = self._setup_animation()
+        writer = PillowWriter(fps=fps) if file_path.lower().endswith('.gif') else FFMpegWriter(fps=fps)
+        with writer.saving(fig, file_path, dpi):
+            for frame in enumerate(self.recorder.replay(self.steps_per_frame)):
+                update(frame)
+                writer.grab_frame()
+        plt.close(fig)
+
+    def plot(self, save_path=None):
+        """
+        Show the animation, or save it to a file.
+
+        Args:
+            save_path (str): Save the animation to this file instead of showing it.
+        """
+        if save_path:
+            self.save(save_path)
+        else:
+            animation = self.animate()  # noqa: F841 -- keep a reference while the window is open
+            plt.show()
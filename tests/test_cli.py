@@ -0,0 +1,73 @@
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CONFIG = os.path.join(ROOT, "config", "default_config.json")
+
+
+def run_cli(*args):
+    """Run the CLI in a fresh interpreter and report the heavy modules it imported."""
+    code = (
+        "import sys; from src.cli import main; main(sys.argv[1:]); "
+        "print('matplotlib' in sys.modules, file=sys.stderr)"
+    )
+    return subprocess.run(
+        [sys.executable, "-c", code, *args],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+
+
+def test_plan_does_not_import_matplotlib():
+    """Testing a plan-only run never loads the plotting stack."""
+    result = run_cli("plan", "--config", CONFIG, "--start", "0", "0", "0", "--goal", "0.2", "0", "0")
+
+    path = json.loads(result.stdout)
+    assert path[0] == [0.0, 0.0, 0.0]
+    assert path[-1] == [0.2, 0.0, 0.0]
+    assert result.stderr.strip().endswith("False")
+
+
+def test_plan_batch_from_cached_graph(tmp_path):
+    """Testing batch planning on a graph cached with the build subcommand."""
+    graph_file = tmp_path / "graph.pkl"
+    queries_file = tmp_path / "queries.json"
+    output_file = tmp_path / "paths.json"
+    queries_file.write_text(json.dumps([
+        {"start": [0, 0, 0], "goal": [1, 1, 1]},
+        {"start": [0, 0, 0], "goal": [0.1, 0, 0]}
+    ]))
+
+    run_cli("build", "--config", CONFIG, "--output", str(graph_file))
+    run_cli("plan", "--graph", str(graph_file), "--planner", "astar",
+            "--queries", str(queries_file), "--output", str(output_file))
+
+    results = json.loads(output_file.read_text())
+    assert len(results) == 2
+    assert results[0]["path"][-1] == [1.0, 1.0, 1.0]
+    assert results[1]["path"] == [[0.0, 0.0, 0.0], [0.1, 0.0, 0.0]]
+
+
+def test_plan_anytime_with_expansion_budget():
+    """Testing the budget options are passed to the anytime planner."""
+    endpoints = ("--config", CONFIG, "--start", "0", "0", "0", "--goal", "1", "1", "1")
+
+    exhausted = run_cli("plan", *endpoints, "--planner", "anytime", "--max-expansions", "1")
+    assert json.loads(exhausted.stdout) is None
+
+    budgeted = run_cli("plan", *endpoints, "--planner", "anytime", "--max-expansions", "200", "--time-budget", "5")
+    path = json.loads(budgeted.stdout)
+    assert path[0] == [0.0, 0.0, 0.0]
+    assert path[-1] == [1.0, 1.0, 1.0]
+
+
+def test_budget_requires_anytime_planner():
+    """Testing budget options are rejected for planners that cannot use them."""
+    result = subprocess.run(
+        [sys.executable, "-c", "import sys; from src.cli import main; main(sys.argv[1:])",
+         "plan", "--config", CONFIG, "--planner", "astar", "--max-expansions", "10"],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    assert result.returncode == 2
+    assert "require --planner anytime" in result.stderr
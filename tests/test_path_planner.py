@@ -1,7 +1,18 @@
+import os
+import time
+
+from src.config_loader import ConfigLoader
 from src.graph import Graph
+from src.path_planner.arastar import AnytimeAStarPathPlanner
+from src.path_planner.astar import AStarPathPlanner
 from src.path_planner.dijkstra import DijkstraPathPlanner
+from src.path_planner.mission import MissionPlanner
+from src.path_planner.prioritized import PrioritizedPathPlanner, ReservationTable
+from src.path_planner.recorder import SearchRecorder
 from src.visualizer import Visualizer2D, Visualizer3D
 
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config", "default_config.json")
+
 
 def test_dijkstra_simple_path():
     """Testing Dijkstra without obstacles."""
@@ -57,3 +68,221 @@ def test_dijkstra_with_obstacles():
 
 # test_dijkstra_simple_path()
 # test_dijkstra_with_obstacles()
+
+
+def test_anytime_astar_converges_to_optimal():
+    """Testing ARA* improves its solution down to the Dijkstra optimum."""
+    config = {
+        "space_size": [1.0, 1.0, 1.0],
+        "grid_resolution": 0.2,
+        "obstacles": [{"start": [0.4, 0.4, 0.4], "end": [0.6, 0.6, 0.6]}]
+    }
+    graph = Graph(config)
+    planner = AnytimeAStarPathPlanner(graph, initial_epsilon=3.0, epsilon_step=0.5)
+
+    start = (0, 0, 0)
+    goal = (1, 1, 1)
+    solutions = list(planner.iter_solutions(start, goal))
+
+    assert solutions
+    assert all(a.epsilon >= b.epsilon for a, b in zip(solutions, solutions[1:]))
+    assert all(a.cost >= b.cost for a, b in zip(solutions, solutions[1:]))
+    assert solutions[-1].epsilon == 1.0
+
+    optimal = DijkstraPathPlanner(graph).plan_path(start, goal)
+    optimal_cost = sum(Graph._calculate_distance(a, b) for a, b in zip(optimal, optimal[1:]))
+    assert abs(solutions[-1].cost - optimal_cost) < 1e-6
+
+
+def test_anytime_astar_expansion_budget():
+    """Testing ARA* stops once the expansion budget is used up."""
+    config = {
+        "space_size": [1.0, 1.0, 1.0],
+        "grid_resolution": 0.2,
+        "obstacles": []
+    }
+    graph = Graph(config)
+    planner = AnytimeAStarPathPlanner(graph)
+
+    assert planner.plan_path((0, 0, 0), (1, 1, 1), max_expansions=1) is None
+
+    path = planner.plan_path((0, 0, 0), (1, 1, 1), max_expansions=100)
+    assert path[0] == (0, 0, 0)
+    assert path[-1] == (1, 1, 1)
+
+
+def test_astar_snaps_arbitrary_endpoints():
+    """Testing A* plans between the free nodes closest to arbitrary points."""
+    config = {
+        "space_size": [1.0, 1.0, 1.0],
+        "grid_resolution": 0.2,
+        "obstacles": [{"start": [0.4, 0.4, 0.4], "end": [0.6, 0.6, 0.6]}]
+    }
+    graph = Graph(config)
+    planner = AStarPathPlanner(graph)
+
+    path = planner.plan_path((0.03, -0.05, 0.08), (0.5, 0.5, 0.5))
+
+    assert path[0] == (0, 0, 0)
+    assert path[-1] in graph.nodes
+    assert path[-1] == graph.nearest_free_node((0.5, 0.5, 0.5))
+
+
+def test_prioritized_planning_avoids_collisions():
+    """Testing prioritized planning keeps robots apart in space and time."""
+    config = {
+        "space_size": [0.4, 0.4, 0.0],
+        "grid_resolution": 0.2,
+        "obstacles": []
+    }
+    graph = Graph(config)
+    planner = PrioritizedPathPlanner(graph)
+
+    # Two robots swapping corners, and one crossing their routes
+    tasks = [((0, 0, 0), (0.4, 0.4, 0)), ((0.4, 0.4, 0), (0, 0, 0)), ((0, 0.4, 0), (0.4, 0, 0))]
+    paths = planner.plan_paths(tasks)
+
+    assert all(path is not None for path in paths)
+    for path, (start, goal) in zip(paths, tasks):
+        assert path[0] == start
+        assert path[-1] == goal
+
+    def position(path, time_step):
+        return path[min(time_step, len(path) - 1)]
+
+    horizon = max(len(path) for path in paths)
+    for time_step in range(horizon):
+        positions = [position(path, time_step) for path in paths]
+        assert len(set(positions)) == len(positions)
+        for i, first in enumerate(paths):
+            for second in paths[i + 1:]:
+                assert not (position(first, time_step) == position(second, time_step + 1)
+                            and position(first, time_step + 1) == position(second, time_step))
+
+    # Diagonal moves crossing in the same cell at the same time are rejected
+    crossing = planner.plan_paths([((0, 0, 0), (0.2, 0.2, 0)), ((0.2, 0, 0), (0, 0.2, 0))])
+    assert all(path is not None for path in crossing)
+    for time_step in range(max(len(path) for path in crossing) - 1):
+        midpoints = [
+            tuple((a + b) / 2 for a, b in zip(position(path, time_step), position(path, time_step + 1)))
+            for path in crossing
+        ]
+        moving = [position(path, time_step) != position(path, time_step + 1) for path in crossing]
+        assert not (all(moving) and midpoints[0] == midpoints[1])
+
+    # A robot starting where a higher priority robot already stands gets no path
+    shared_start = planner.plan_paths([((0, 0, 0), (0.4, 0, 0)), ((0, 0, 0), (0, 0.4, 0))])
+    assert shared_start[0] is not None
+    assert shared_start[1] is None
+
+
+def test_prioritized_planning_matches_astar_in_maze():
+    """Testing a single robot finds the same long detour as plain A* in a serpentine maze."""
+    walls = [
+        {"start": [0.0 if k % 2 == 0 else 0.2, y, 0.0], "end": [1.8 if k % 2 == 0 else 2.0, y, 0.0]}
+        for k, y in enumerate([0.2, 0.6, 1.0, 1.4, 1.8])
+    ]
+    graph = Graph({"space_size": [2.0, 2.0, 0.0], "grid_resolution": 0.1, "obstacles": walls})
+
+    single_path = AStarPathPlanner(graph).plan_path((0, 0, 0), (0, 2, 0))
+    paths = PrioritizedPathPlanner(graph).plan_paths([((0, 0, 0), (0, 2, 0))])
+
+    assert paths[0] is not None
+    assert len(paths[0]) == len(single_path)
+    assert paths[0][-1] == (0, 2, 0)
+
+
+def test_prioritized_planning_blocked_goal_returns_quickly():
+    """Testing a goal taken by a parked robot is rejected without a long search."""
+    graph = Graph(ConfigLoader().load_config(CONFIG_PATH))
+    planner = PrioritizedPathPlanner(graph)
+
+    started = time.perf_counter()
+    paths = planner.plan_paths([((0, 0, 0), (1, 1, 1)), ((1, 0, 0), (1, 1, 1))])
+
+    assert paths[0] is not None
+    assert paths[1] is None
+    assert time.perf_counter() - started < 1.0
+
+
+def test_reservation_table_parks_robots_at_goal():
+    """Testing a robot that reached its goal keeps blocking it."""
+    reservations = ReservationTable()
+    reservations.reserve_path([(0, 0, 0), (0.2, 0, 0)], robot=0)
+
+    assert not reservations.is_free((0, 0, 0), 0)
+    assert reservations.is_free((0, 0, 0), 1)
+    assert not reservations.is_free((0.2, 0, 0), 10)
+    assert not reservations.is_move_free((0.2, 0, 0), (0, 0, 0), 0)
+    assert not reservations.can_stay((0.2, 0, 0), 5)
+
+
+def test_mission_cost_matrix_matches_dijkstra():
+    """Testing the multi-target cost matrix against pairwise Dijkstra searches."""
+    config = {
+        "space_size": [1.0, 1.0, 1.0],
+        "grid_resolution": 0.2,
+        "obstacles": [{"start": [0.4, 0.4, 0.4], "end": [0.6, 0.6, 0.6]}]
+    }
+    graph = Graph(config)
+    waypoints = [(0, 0, 0), (1, 1, 1), (0, 1, 0.2), (0.8, 0, 0.6)]
+
+    matrix, paths = MissionPlanner(graph).cost_matrix(waypoints)
+    dijkstra = DijkstraPathPlanner(graph)
+
+    for i, start in enumerate(waypoints):
+        for j, goal in enumerate(waypoints):
+            path = dijkstra.plan_path(start, goal)
+            cost = sum(Graph._calculate_distance(a, b) for a, b in zip(path, path[1:]))
+            assert abs(matrix[i, j] - cost) < 1e-9
+            assert paths[i][j][0] == start
+            assert paths[i][j][-1] == goal
+
+
+def test_mission_visit_order():
+    """Testing the mission visits waypoints along a line in order and stitches the path."""
+    config = {
+        "space_size": [1.0, 0.2, 0.2],
+        "grid_resolution": 0.2,
+        "obstacles": []
+    }
+    graph = Graph(config)
+    waypoints = [(0, 0, 0), (0.6, 0, 0), (0.2, 0, 0), (1.0, 0, 0), (0.4, 0, 0)]
+
+    plan = MissionPlanner(graph).plan_mission(waypoints)
+
+    assert plan.order == [0, 2, 4, 1, 3]
+    assert abs(plan.cost - 1.0) < 1e-9
+    assert plan.path[0] == (0, 0, 0)
+    assert plan.path[-1] == (1.0, 0, 0)
+    assert len(plan.path) == 6
+
+    round_trip = MissionPlanner(graph).plan_mission(waypoints, return_to_start=True)
+    assert abs(round_trip.cost - 2.0) < 1e-9
+    assert round_trip.path[-1] == (0, 0, 0)
+
+
+def test_search_recorder_replay():
+    """Testing the recorded expansions replay to the planned path."""
+    config = {
+        "space_size": [1.0, 1.0, 1.0],
+        "grid_resolution": 0.2,
+        "obstacles": [{"start": [0.4, 0.4, 0.4], "end": [0.6, 0.6, 0.6]}]
+    }
+    graph = Graph(config)
+    recorder = SearchRecorder()
+    path = DijkstraPathPlanner(graph).plan_path((0, 0, 0), (1, 1, 1), on_expand=recorder)
+
+    assert recorder.expanded_nodes[0] == (0, 0, 0)
+    assert recorder.expanded_nodes[-1] == (1, 1, 1)
+
+    frames = list(recorder.replay(steps_per_frame=10))
+    closed_count, frontier, last_path = frames[-1]
+    assert len(frames) == -(-len(recorder) // 10)
+    assert closed_count == len(recorder)
+    assert (1, 1, 1) not in frontier
+    assert last_path == path
+
+    # Each frame keeps its own snapshot of the frontier
+    assert frames[0][1] != frontier
+    assert frames[0][1] <= {neighbor for _, opened in recorder.events[:10] for neighbor in opened}
@@ -0,0 +1,53 @@
+from src.graph import Graph
+from src.path_planner.astar import AStarPathPlanner
+from src.tiled_graph import TiledGraph
+
+
+CONFIG = {
+    "space_size": [1.0, 1.0, 1.0],
+    "grid_resolution": 0.2,
+    "obstacles": [{"start": [0.4, 0.4, 0.4], "end": [0.6, 0.6, 0.6]}]
+}
+
+
+def test_tiled_graph_matches_graph(tmp_path):
+    """Testing the tiled graph has the same nodes and edges as the in-memory graph."""
+    graph = Graph(CONFIG)
+    tiled = TiledGraph.build(CONFIG, str(tmp_path), chunk_size=4)
+
+    assert len(tiled.nodes) == len(graph.nodes)
+    assert set(tiled.nodes) == graph.nodes
+    for node in graph.nodes:
+        assert sorted(tiled.edges[node]) == sorted(graph.edges[node])
+
+
+def test_planning_on_tiled_graph_with_small_cache(tmp_path):
+    """Testing A* on a tiled graph whose chunk cache is smaller than the map."""
+    tiled = TiledGraph.build(CONFIG, str(tmp_path), chunk_size=2, workers=1, max_cache_bytes=16)
+
+    tiled_path = AStarPathPlanner(tiled).plan_path((0, 0, 0), (1, 1, 1))
+    path = AStarPathPlanner(Graph(CONFIG)).plan_path((0, 0, 0), (1, 1, 1))
+
+    def cost(nodes):
+        return sum(Graph._calculate_distance(a, b) for a, b in zip(nodes, nodes[1:]))
+
+    assert tiled_path[0] == (0, 0, 0)
+    assert tiled_path[-1] == (1, 1, 1)
+    assert abs(cost(tiled_path) - cost(path)) < 1e-9
+
+
+def test_chunk_cache_stays_within_cap(tmp_path):
+    """Testing the chunk cache stays bounded while the whole map is traversed."""
+    config = dict(CONFIG, obstacles=[
+        {"start": [0.0, 0.0, 0.0], "end": [0.0, 1.0, 1.0]},
+        {"start": [0.4, 0.4, 0.4], "end": [0.6, 0.6, 0.6]}
+    ])
+    # 2x2x2 chunks hold 8 one-byte mask entries, so at most two fit in the cache
+    tiled = TiledGraph.build(config, str(tmp_path), chunk_size=2, workers=1, max_cache_bytes=16)
+
+    max_cached = 0
+    for _ in tiled.edges.items():
+        max_cached = max(max_cached, len(tiled.cached_chunks))
+
+    assert len(tiled.nodes) == len(Graph(config).nodes)
+    assert 0 < max_cached <= 2
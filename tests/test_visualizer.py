@@ -1,6 +1,8 @@
 from src.graph import Graph
+from src.path_planner.astar import AStarPathPlanner
 from src.path_planner.dijkstra import DijkstraPathPlanner
-from src.visualizer import Visualizer2D, Visualizer3D
+from src.path_planner.recorder import SearchRecorder
+from src.visualizer import SearchAnimator3D, Visualizer2D, Visualizer3D
 
 
 def test_dijkstra_simple_path():
@@ -48,3 +50,23 @@ def test_dijkstra_with_obstacles():
 
 # test_dijkstra_simple_path()
 # test_dijkstra_with_obstacles()
+
+
+def test_search_animation_gif(tmp_path):
+    """Testing a recorded search is written offscreen to a GIF."""
+    config = {
+        "space_size": [1.0, 1.0, 1.0],
+        "grid_resolution": 0.2,
+        "obstacles": [{"start": [0.4, 0.4, 0.4], "end": [0.6, 0.6, 0.6]}]
+    }
+    graph = Graph(config)
+    recorder = SearchRecorder()
+    path = AStarPathPlanner(graph).plan_path((0, 0, 0), (1, 1, 1), on_expand=recorder)
+
+    output = tmp_path / "search.gif"
+    animator = SearchAnimator3D(graph=graph, recorder=recorder, path=path, max_frames=5)
+    animator.save(str(output), fps=5, dpi=40)
+
+    assert animator.steps_per_frame * 5 >= len(recorder)
+    assert output.exists()
+    assert output.stat().st_size > 0
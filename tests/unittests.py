@@ -44,6 +44,21 @@ class TestGraph(unittest.TestCase):
         self.assertTrue(any(n[0] == (0.5, 0.0, 0.0) for n in neighbors))
         self.assertTrue(any(n[0] == (0.0, 0.5, 0.0) for n in neighbors))
 
+    def test_nearest_free_node(self):
+        self.assertEqual(self.graph.nearest_free_node((0.1, 0.2, -0.3)), (0.0, 0.0, 0.0))
+        self.assertEqual(self.graph.nearest_free_node((0.9, 0.9, 0.8)), (1.0, 1.0, 0.0))
+
+    def test_nearest_free_nodes_batch(self):
+        points = [(0.1, 0.2, -0.3), (0.6, 0.1, 0.0), (0.9, 0.9, 0.8)]
+        self.assertEqual(
+            self.graph.nearest_free_nodes(points),
+            [self.graph.nearest_free_node(point) for point in points]
+        )
+
+    def test_nearest_free_node_max_radius(self):
+        with self.assertRaises(ValueError):
+            self.graph.nearest_free_node((1.0, 1.0, 1.0), max_radius=0)
+
 
 class TestDijkstraPathPlanner(unittest.TestCase):
 
@@ -60,6 +75,10 @@ class TestDijkstraPathPlanner(unittest.TestCase):
         path = self.planner.plan_path((0.0, 0.0, 0.0), (0.5, 0.0, 0.0))
         self.assertEqual(path, [(0.0, 0.0, 0.0), (0.5, 0.0, 0.0)])
 
+    def test_snapped_endpoints(self):
+        path = self.planner.plan_path((0.1, -0.1, 0.05), (0.45, 0.1, 0.0))
+        self.assertEqual(path, [(0.0, 0.0, 0.0), (0.5, 0.0, 0.0)])
+
 
 class TestVisualizer(unittest.TestCase):
 